@@ -6,6 +6,7 @@ functions that can be used to run quality control tests.
 import pandas as pd
 import numpy as np
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 none_list = ['','none','None','NONE', None, [], {}]
 NoneType = type(None)
@@ -38,6 +39,50 @@ def _documented_by(original):
         return target
     return wrapper
 
+def _rolling_argminmax(values, start, stop, max_size=2**20):
+    """
+    Return the position of the min and max value within each window
+    values[start:stop+1], NaN values are skipped.  The first occurrence is
+    returned if the min or max value occurs more than once in a window.
+    Windows are processed in chunks of at most max_size elements.
+    """
+    values = np.asarray(values, dtype=float)
+    imin = np.empty(len(start), dtype=int)
+    imax = np.empty(len(start), dtype=int)
+    if len(start) == 0:
+        return imin, imax
+
+    width = int((stop - start).max()) + 1
+    offset = np.arange(width)
+    step = max(1, max_size//width)
+    for i in range(0, len(start), step):
+        s = start[i:i+step, np.newaxis]
+        e = stop[i:i+step, np.newaxis]
+        pos = s + offset
+        invalid = pos > e
+        window = values[np.where(invalid, e, pos)]
+        invalid = invalid | np.isnan(window)
+        imin[i:i+step] = s[:,0] + np.where(invalid, np.inf, window).argmin(axis=1)
+        imax[i:i+step] = s[:,0] + np.where(invalid, -np.inf, window).argmax(axis=1)
+
+    return imin, imax
+
+def _apply_by_column_chunks(func, ncols, n_jobs=1):
+    """
+    Call func with chunks of column positions and concatenate the resulting
+    DataFrames along the columns.  If n_jobs > 1, chunks are processed in
+    parallel using a pool of threads (the pandas rolling window and numpy 
+    operations used in the quality control tests release the GIL).
+    """
+    if n_jobs == 1 or ncols < 2:
+        return func(slice(None))
+
+    chunks = np.array_split(np.arange(ncols), min(n_jobs, ncols))
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        results = list(executor.map(func, chunks))
+
+    return pd.concat(results, axis=1)
+
 ### Object-oriented approach
 class PerformanceMonitoring(object):
 
@@ -48,9 +93,61 @@ class PerformanceMonitoring(object):
         self.df = pd.DataFrame()
         self.trans = {}
         self.tfilter = pd.Series()
-        self.test_results = pd.DataFrame(columns=['Variable Name',
+
+        self._test_results = pd.DataFrame(columns=['Variable Name',
                                                 'Start Time', 'End Time',
                                                 'Timesteps', 'Error Flag'])
+        # New test results are collected in lists and added to the
+        # test_results DataFrame when it is accessed
+        self._var_names = []
+        self._start_times = []
+        self._end_times = []
+        self._timesteps = []
+        self._error_flags = []
+
+        # Cached int64 representation of self.df.index, see _index_i8
+        self._index_cache = None
+
+    @property
+    def test_results(self):
+        """
+        Summary of the quality control test results
+
+        Returns
+        --------
+        pandas DataFrame
+            Variable name, start time, end time, number of timesteps, and
+            error flag for each quality control test failure
+        """
+        if self._var_names:
+            frame = pd.DataFrame({
+                'Variable Name': np.array(self._var_names, dtype=object),
+                'Start Time': self._start_times,
+                'End Time': self._end_times,
+                'Timesteps': np.array(self._timesteps, dtype=object),
+                'Error Flag': np.array(self._error_flags, dtype=object)},
+                columns=self._test_results.columns)
+            self._test_results = pd.concat([self._test_results, frame],
+                                           ignore_index=True)
+            self._clear_new_test_results()
+
+        return self._test_results
+
+    @test_results.setter
+    def test_results(self, test_results):
+        self._test_results = test_results
+        self._clear_new_test_results()
+
+    def _clear_new_test_results(self):
+        """
+        Clear the lists of test results that have not been added to the
+        test_results DataFrame
+        """
+        self._var_names = []
+        self._start_times = []
+        self._end_times = []
+        self._timesteps = []
+        self._error_flags = []
 
     @property
     def mask(self):
@@ -68,16 +165,16 @@ class PerformanceMonitoring(object):
             logger.info("Empty database")
             return
 
-        mask = ~pd.isnull(self.df) # False if NaN
-        for i in self.test_results.index:
-            variable = self.test_results.loc[i, 'Variable Name']
-            start_date = self.test_results.loc[i, 'Start Time']
-            end_date = self.test_results.loc[i, 'End Time']
-            if variable in mask.columns:
-                try:
-                    mask.loc[start_date:end_date,variable] = False
-                except:
-                    pass
+        columns = self.df.columns
+        mask = ~pd.isnull(self.df).values # False if NaN
+        test_results = self.test_results
+        rows = self._row_slices(test_results['Start Time'],
+                                test_results['End Time'])
+        for variable, row in zip(test_results['Variable Name'], rows):
+            if (variable in columns) and (row is not None):
+                mask[row, columns.get_loc(variable)] = False
+
+        mask = pd.DataFrame(mask, index=self.df.index, columns=columns)
 
         return mask
 
@@ -94,6 +191,51 @@ class PerformanceMonitoring(object):
         """
         return self.df[self.mask]
 
+    def _index_i8(self):
+        """
+        Return self.df.index as int64 nanoseconds.  The array is cached and 
+        recomputed when self.df.index is replaced.
+        """
+        index = self.df.index
+        if self._index_cache is None or self._index_cache[0] is not index:
+            self._index_cache = (index, index.asi8)
+        
+        return self._index_cache[1]
+
+    def _row_slices(self, start_times, end_times):
+        """
+        Return a list of row slices in self.df.index between each start and 
+        end time (inclusive).  None is returned if the slice can not be
+        located.
+        """
+        index = self.df.index
+        if len(start_times) == 0:
+            return []
+        
+        try:
+            start_index = pd.DatetimeIndex(start_times)
+            end_index = pd.DatetimeIndex(end_times)
+            same_tz = ((start_index.tz is None) == (index.tz is None)) and \
+                      ((end_index.tz is None) == (index.tz is None))
+        except:
+            same_tz = False
+
+        if index.is_monotonic_increasing and same_tz:
+            # Locate all slices at once using the int64 index
+            index_i8 = self._index_i8()
+            start = np.searchsorted(index_i8, start_index.asi8, side='left')
+            stop = np.searchsorted(index_i8, end_index.asi8, side='right')
+            return [slice(i, j) for i, j in zip(start, stop)]
+
+        rows = []
+        for start_time, end_time in zip(start_times, end_times):
+            try:
+                rows.append(index.slice_indexer(start_time, end_time))
+            except:
+                rows.append(None)
+
+        return rows
+
     def _setup_data(self, key):
         """
         Setup data to use in the quality control test
@@ -119,16 +261,24 @@ class PerformanceMonitoring(object):
         Compare DataFrame to bounds to generate a True/False mask where
         True = passed, False = failed.  Append results to test_results.
         """
-        
+        # Compare using the underlying numpy array (NaN compares as False),
+        # the same boolean buffer is used for the lower and upper bound
+        data = df.values
+        buffer = np.empty(data.shape, dtype=bool)
+
         # Lower Bound
         if bound[0] not in none_list:
-            mask = (df < bound[0])
+            with np.errstate(invalid='ignore'):
+                np.less(data, bound[0], out=buffer)
+            mask = pd.DataFrame(buffer, index=df.index, columns=df.columns)
             error_msg = error_prefix+' < lower bound, '+str(bound[0])
             self._append_test_results(mask, error_msg, min_failures)
 
         # Upper Bound
         if bound[1] not in none_list:
-            mask = (df > bound[1])
+            with np.errstate(invalid='ignore'):
+                np.greater(data, bound[1], out=buffer)
+            mask = pd.DataFrame(buffer, index=df.index, columns=df.columns)
             error_msg = error_prefix+' > upper bound, '+str(bound[1])
             self._append_test_results(mask, error_msg, min_failures)
 
@@ -155,8 +305,15 @@ class PerformanceMonitoring(object):
             pm.df to extract test results. Default = False
         """
         if not self.tfilter.empty:
-            mask[~self.tfilter] = False
-        if mask.sum(axis=1).sum(axis=0) == 0:
+            if self.tfilter.index.equals(mask.index):
+                # Apply the time filter to the underlying numpy array
+                np_mask = np.asarray(mask.values, dtype=bool)
+                np_mask[~self.tfilter.values.astype(bool),:] = False
+                mask = pd.DataFrame(np_mask, index=mask.index,
+                                    columns=mask.columns)
+            else:
+                mask[~self.tfilter] = False
+        if not mask.values.any():
             return
 
         if use_mask_only:
@@ -164,51 +321,32 @@ class PerformanceMonitoring(object):
         else:
             sub_df = self.df[mask.columns]
 
-        # Find blocks
-        order = 'col'
-        if order == 'col':
-            mask = mask.T
-
-        np_mask = mask.values
-
-        start_nans_mask = np.hstack(
-            (np.resize(np_mask[:,0],(mask.shape[0],1)),
-             np.logical_and(np.logical_not(np_mask[:,:-1]), np_mask[:,1:])))
-        stop_nans_mask = np.hstack(
-            (np.logical_and(np_mask[:,:-1], np.logical_not(np_mask[:,1:])),
-             np.resize(np_mask[:,-1], (mask.shape[0],1))))
-
-        start_row_idx,start_col_idx = np.where(start_nans_mask)
-        stop_row_idx,stop_col_idx = np.where(stop_nans_mask)
-
-        if order == 'col':
-            temp = start_row_idx; start_row_idx = start_col_idx; start_col_idx = temp
-            temp = stop_row_idx; stop_row_idx = stop_col_idx; stop_col_idx = temp
-            #mask = mask.T
-
-        block = {'Start Row': list(start_row_idx),
-                 'Start Col': list(start_col_idx),
-                 'Stop Row': list(stop_row_idx),
-                 'Stop Col': list(stop_col_idx)}
-
-        #if sub_df is None:
-        #    sub_df = self.df
-
-        for i in range(len(block['Start Col'])):
-            length = block['Stop Row'][i] - block['Start Row'][i] + 1
-            if length >= min_failures:
-                if use_mask_only:
-                    var_name = ''
-                else:
-                    var_name = sub_df.iloc[:,block['Start Col'][i]].name #sub_df.icol(block['Start Col'][i]).name
+        # Find blocks along the time axis, pad with False on each end, a
+        # block starts where the difference is 1 and stops one element
+        # before the difference is -1
+        np_mask = mask.values.astype(np.int8)
+        diff_mask = np.diff(np.pad(np_mask, ((1,1),(0,0)), 'constant'), axis=0)
 
-                frame = pd.DataFrame([var_name,
-                    sub_df.index[block['Start Row'][i]],
-                    sub_df.index[block['Stop Row'][i]],
-                    length, error_msg],
-                    index=['Variable Name', 'Start Time',
-                    'End Time', 'Timesteps', 'Error Flag'])
-                self.test_results = self.test_results.append(frame.T, ignore_index=True)
+        # Blocks are ordered by column, then by time
+        start_col_idx,start_row_idx = np.where(diff_mask.T == 1)
+        stop_col_idx,stop_row_idx = np.where(diff_mask.T == -1)
+        stop_row_idx = stop_row_idx - 1
+
+        length = stop_row_idx - start_row_idx + 1
+        keep = length >= min_failures
+        if not keep.any():
+            return
+
+        if use_mask_only:
+            var_names = ['']*int(keep.sum())
+        else:
+            var_names = list(sub_df.columns.values[start_col_idx[keep]])
+
+        self._var_names.extend(var_names)
+        self._start_times.extend(sub_df.index[start_row_idx[keep]])
+        self._end_times.extend(sub_df.index[stop_row_idx[keep]])
+        self._timesteps.extend(length[keep])
+        self._error_flags.extend([error_msg]*len(var_names))
 
     def add_dataframe(self, data):
         """
@@ -224,15 +362,19 @@ class PerformanceMonitoring(object):
         
         temp = data.copy()
 
-        if self.df is not None:
-            self.df = temp.combine_first(self.df)
-        else:
+        if self.df is None or self.df.shape == (0,0):
             self.df = temp
+        elif temp.index.equals(self.df.index) and \
+                temp.columns.intersection(self.df.columns).empty:
+            # New columns with the same index (e.g. composite signals), there
+            # are no values to combine so the columns are concatenated
+            columns = temp.columns.union(self.df.columns)
+            self.df = pd.concat([self.df, temp], axis=1)[columns]
+        else:
+            self.df = temp.combine_first(self.df)
 
         # Add identity 1:1 translation dictionary
-        trans = {}
-        for col in temp.columns:
-            trans[col] = [col]
+        trans = {col: [col] for col in temp.columns}
 
         self.add_translation_dictionary(trans)
 
@@ -247,10 +389,7 @@ class PerformanceMonitoring(object):
         """
         assert isinstance(trans, dict), 'trans must be of type dictionary'
         
-        for key, values in trans.items():
-            self.trans[key] = []
-            for value in values:
-                self.trans[key].append(value)
+        self.trans.update({key: list(values) for key, values in trans.items()})
 
     def add_time_filter(self, time_filter):
         """
@@ -314,20 +453,19 @@ class PerformanceMonitoring(object):
             logger.info("Empty database")
             return
         if expected_start_time is None:
-            expected_start_time = min(self.df.index)
+            expected_start_time = self.df.index.min()
         if expected_end_time is None:
-            expected_end_time = max(self.df.index)
+            expected_end_time = self.df.index.max()
 
         rng = pd.date_range(start=expected_start_time, end=expected_end_time,
                             freq=str(int(frequency*1e3)) + 'ms') # milliseconds
 
         # Check to see if timestamp is monotonic
-#        mask = pd.TimeSeries(self.df.index).diff() < 0
-        mask = pd.Series(self.df.index).diff() < pd.Timedelta('0 days 00:00:00')
-        mask.index = self.df.index
-        mask[mask.index[0]] = False
-        mask = pd.DataFrame(mask)
-        mask.columns = [0]
+        ns = self._index_i8() # int64 nanoseconds
+        mask = np.zeros(len(ns), dtype=bool)
+        mask[1:] = np.diff(ns) < 0
+        mask[ns == ns[0]] = False
+        mask = pd.DataFrame(mask, index=self.df.index, columns=[0])
 
         self._append_test_results(mask, 'Nonmonotonic timestamp',
                                  use_mask_only=True,
@@ -338,35 +476,30 @@ class PerformanceMonitoring(object):
             self.df = self.df.sort_index()
 
         # Check for duplicate timestamps
-#        mask = pd.TimeSeries(self.df.index).diff() == 0
-        mask = pd.Series(self.df.index).diff() == pd.Timedelta('0 days 00:00:00')
-        mask.index = self.df.index
-        mask[mask.index[0]] = False
-        mask = pd.DataFrame(mask)
-        mask.columns = [0]
-        mask['TEMP'] = mask.index # remove duplicates in the mask
-        mask.drop_duplicates(subset='TEMP', keep='last', inplace=True)
-        del mask['TEMP']
+        ns = self._index_i8() # int64 nanoseconds
+        mask = np.zeros(len(ns), dtype=bool)
+        mask[1:] = np.diff(ns) == 0
+        mask[ns == ns[0]] = False
+        mask = pd.DataFrame(mask, index=self.df.index, columns=[0])
+        # remove duplicates in the mask
+        mask = mask[~mask.index.duplicated(keep='last')]
 
         # Drop duplicate timestamps (this has to be done before the
         # results are appended)
-        self.df['TEMP'] = self.df.index
-        #self.df.drop_duplicates(subset='TEMP', take_last=False, inplace=True)
-        self.df.drop_duplicates(subset='TEMP', keep='first', inplace=True)
+        self.df = self.df[~self.df.index.duplicated(keep='first')]
 
         self._append_test_results(mask, 'Duplicate timestamp',
                                  use_mask_only=True,
                                  min_failures=min_failures)
-        del self.df['TEMP']
 
         if exact_times:
             temp = pd.Index(rng)
-            missing = temp.difference(self.df.index).tolist()
+            missing = temp.difference(self.df.index)
             # reindex DataFrame
             self.df = self.df.reindex(index=rng)
-            mask = pd.DataFrame(data=self.df.shape[0]*[False],
-                                index=self.df.index)
-            mask.loc[missing] = True
+            mask = np.zeros(self.df.shape[0], dtype=bool)
+            mask[self.df.index.get_indexer(missing)] = True
+            mask = pd.DataFrame(mask, index=self.df.index)
             self._append_test_results(mask, 'Missing timestamp',
                                  use_mask_only=True,
                                  min_failures=min_failures)
@@ -453,7 +586,17 @@ class PerformanceMonitoring(object):
             return
 
         # Compute interval
-        if absolute_value:
+        data = df.values
+        if increment == 1 and data.dtype.kind in 'iuf':
+            # Difference between consecutive time steps, computed in place
+            # on the numpy array
+            diff = np.empty(data.shape, dtype=float)
+            diff[0] = np.nan
+            np.subtract(data[1:], data[:-1], out=diff[1:])
+            if absolute_value:
+                np.abs(diff, out=diff)
+            df = pd.DataFrame(diff, index=df.index, columns=df.columns)
+        elif absolute_value:
             df = np.abs(df.diff(periods=increment))
         else:
             df = df.diff(periods=increment)
@@ -467,7 +610,7 @@ class PerformanceMonitoring(object):
     
 
     def check_delta(self, bound, key=None, window=3600,  direction=None, 
-                    min_failures=1):
+                    min_failures=1, n_jobs=1):
         """
         Check for stagnant data and/or abrupt changes in the data using the 
         difference between max and min values (delta) within a rolling window
@@ -499,12 +642,17 @@ class PerformanceMonitoring(object):
         min_failures : int (optional)
             Minimum number of consecutive failures required for reporting,
             default = 1
+
+        n_jobs : int (optional)
+            Number of threads used to process columns in parallel, 
+            default = 1
         """
         assert isinstance(bound, list), 'bound must be of type list'
         assert isinstance(key, (NoneType, str)), 'key must be None or of type string'
         assert isinstance(window, (int, float)), 'window must be of type int or float'
         assert direction in [None, 'positive', 'negative'], "direction must None or the string 'positive' or 'negative'"
         assert isinstance(min_failures, int), 'min_failures must be of type int'
+        assert isinstance(n_jobs, int) and n_jobs > 0, 'n_jobs must be a positive int'
         assert self.df.index.is_monotonic, 'index must be monotonic'
         
         logger.info("Check for stagant data and/or abrupt changes using delta (max-min) within a rolling window")
@@ -515,10 +663,11 @@ class PerformanceMonitoring(object):
 
         window_str = str(int(window*1e3)) + 'ms' # milliseconds
 
-        min_df = df.rolling(window_str, min_periods=2, closed='both').min()
-        max_df = df.rolling(window_str, min_periods=2, closed='both').max()
+        def compute_delta(cols):
+            rolling = df.iloc[:,cols].rolling(window_str, min_periods=2, closed='both')
+            return rolling.max() - rolling.min()
 
-        diff_df = max_df - min_df
+        diff_df = _apply_by_column_chunks(compute_delta, df.shape[1], n_jobs)
         diff_df.loc[diff_df.index[0]:diff_df.index[0]+pd.Timedelta(window_str),:] = None
         
         def update_mask(mask1, df, window_str, bound, direction):
@@ -528,40 +677,55 @@ class PerformanceMonitoring(object):
             # This function uses numpy arrays to improve performance and returns
             # a mask DataFrame.
             mask2 = np.zeros((len(mask1.index), len(mask1.columns)), dtype=bool)
-            index = mask1.index
-            # Loop over t, col in mask1 where condition is True
-            for t,col in list(mask1[mask1 > 0].stack().index):
-                icol = mask1.columns.get_loc(col)
-                it = mask1.index.get_loc(t)
-                t1 = t-pd.Timedelta(window_str)
+            # Work with int64 nanoseconds to avoid Timestamp conversions
+            index = mask1.index.asi8
+            window = pd.Timedelta(window_str).value
+            for icol in range(len(mask1.columns)):
+                # Rows in mask1 where condition is True
+                rows = np.flatnonzero(mask1.iloc[:,icol].values)
+                if len(rows) == 0:
+                    continue
+                start = np.searchsorted(index, index[rows] - window, side='left')
+                stop = np.searchsorted(index, index[rows], side='right') - 1
 
                 if (bound == 'lower') and (direction is None):
                     # set the entire time interval to True
-                    mask2[(index >= t1) & (index <= t),icol] = True
-                
-                else: 
+                    keep = np.ones(len(rows), dtype=bool)
+                else:
                     # extract the min and max time
-                    min_time = df.loc[t1:t,col].idxmin()
-                    max_time = df.loc[t1:t,col].idxmax()
-                    
-                    if bound == 'lower': # bound = upper, direction = positive or negative
+                    imin, imax = _rolling_argminmax(df.iloc[:,icol].values,
+                                                    start, stop)
+                    min_time = index[imin]
+                    max_time = index[imax]
+
+                    if bound == 'lower': # bound = lower, direction = positive or negative
                         # set the entire time interval to True
-                        if (direction == 'positive') and (min_time <= max_time):
-                            mask2[(index >= t1) & (index <= t),icol] = True
-                        elif (direction == 'negative') and (min_time >= max_time):
-                            mask2[(index >= t1) & (index <= t),icol] = True
-                    
+                        if direction == 'positive':
+                            keep = min_time <= max_time
+                        else:
+                            keep = min_time >= max_time
+
                     elif bound == 'upper': # bound = upper, direction = None, positive or negative
-                        # set the initially flaged location to False
-                        mask2[it,icol] = False
-                        # set the time between max/min or min/max to true
-                        if min_time < max_time and (direction is None or direction == 'positive'):
-                            mask2[(index >= min_time) & (index <= max_time),icol] = True
-                        elif min_time > max_time and (direction is None or direction == 'negative'):
-                            mask2[(index >= max_time) & (index <= min_time),icol] = True
-                        elif min_time == max_time:
-                            mask2[it,icol] = True
-                        
+                        # set the time between max/min or min/max to true,
+                        # the initially flagged location is only kept if the
+                        # min and max time are the same
+                        keep = min_time == max_time
+                        if direction in [None, 'positive']:
+                            keep = keep | (min_time < max_time)
+                        if direction in [None, 'negative']:
+                            keep = keep | (min_time > max_time)
+                        start = np.where(min_time == max_time, rows,
+                                np.searchsorted(index, np.minimum(min_time, max_time), side='left'))
+                        stop = np.where(min_time == max_time, rows,
+                                np.searchsorted(index, np.maximum(min_time, max_time), side='right') - 1)
+
+                # Paint intervals [start, stop] using the cumulative sum of
+                # +1 at each start and -1 after each stop
+                delta = np.zeros(len(index)+1, dtype=int)
+                np.add.at(delta, start[keep], 1)
+                np.add.at(delta, stop[keep]+1, -1)
+                mask2[:,icol] = np.cumsum(delta)[:-1] > 0
+
             mask2 = pd.DataFrame(mask2, columns=mask1.columns, index=mask1.index)
             return mask2
         
@@ -574,25 +738,29 @@ class PerformanceMonitoring(object):
         
         # Lower Bound
         if bound[0] not in none_list:
-            mask = (diff_df < bound[0])
+            mask1 = (diff_df < bound[0])
             error_msg = error_prefix+' < lower bound, '+str(bound[0])
             if not self.tfilter.empty:
-                mask[~self.tfilter] = False
-            mask = update_mask(mask, df, window_str, 'lower', direction) 
+                mask1[~self.tfilter] = False
+            mask = _apply_by_column_chunks(lambda cols: update_mask(
+                mask1.iloc[:,cols], df.iloc[:,cols], window_str, 'lower', direction),
+                df.shape[1], n_jobs)
             self._append_test_results(mask, error_msg, min_failures)
         
         # Upper Bound
         if bound[1] not in none_list:
-            mask = (diff_df > bound[1])
+            mask1 = (diff_df > bound[1])
             error_msg = error_prefix+' > upper bound, '+str(bound[1])
             if not self.tfilter.empty:
-                mask[~self.tfilter] = False
-            mask = update_mask(mask, df, window_str, 'upper', direction) 
+                mask1[~self.tfilter] = False
+            mask = _apply_by_column_chunks(lambda cols: update_mask(
+                mask1.iloc[:,cols], df.iloc[:,cols], window_str, 'upper', direction),
+                df.shape[1], n_jobs)
             self._append_test_results(mask, error_msg, min_failures)
 
 
     def check_outlier(self, bound, key=None, window=3600, absolute_value=True, 
-                      min_failures=1):
+                      min_failures=1, n_jobs=1):
         """
         Check for outliers using normalized data within a rolling window
         
@@ -620,12 +788,17 @@ class PerformanceMonitoring(object):
         min_failures : int (optional)
             Minimum number of consecutive failures required for reporting,
             default = 1
+
+        n_jobs : int (optional)
+            Number of threads used to process columns in parallel, 
+            default = 1
         """
         assert isinstance(bound, list), 'bound must be of type list'
         assert isinstance(key, (NoneType, str)), 'key must be None or of type string'
         assert isinstance(window, (NoneType, int, float)), 'window must be None or of type int or float'
         assert isinstance(absolute_value, bool), 'absolute_value must be of type bool'
         assert isinstance(min_failures, int), 'min_failures must be type int'
+        assert isinstance(n_jobs, int) and n_jobs > 0, 'n_jobs must be a positive int'
         assert self.df.index.is_monotonic, 'index must be monotonic'
         
         logger.info("Check for outliers")
@@ -637,9 +810,17 @@ class PerformanceMonitoring(object):
         # Compute normalized data
         if window is not None:
             window_str = str(int(window*1e3)) + 'ms' # milliseconds
-            df_mean = df.rolling(window_str, min_periods=2, closed='both').mean()
-            df_std = df.rolling(window_str, min_periods=2, closed='both').std()
-            df = (df - df_mean)/df_std
+
+            def normalize(cols):
+                data = df.iloc[:,cols]
+                rolling = data.rolling(window_str, min_periods=2, closed='both')
+                df_mean = rolling.mean().values
+                df_std = rolling.std().values
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    return pd.DataFrame((data.values - df_mean)/df_std,
+                                        index=data.index, columns=data.columns)
+
+            df = _apply_by_column_chunks(normalize, df.shape[1], n_jobs)
         else:
             df = (df - df.mean())/df.std()
         if absolute_value:
@@ -679,12 +860,21 @@ class PerformanceMonitoring(object):
             return
 
         # Extract missing data
-        mask = pd.isnull(df) # checks for np.nan, np.inf
+        data = df.values
+        if data.dtype.kind == 'f':
+            mask = np.isnan(data)
+        else:
+            mask = pd.isnull(df).values
 
         missing_timestamps = self.test_results[
                 self.test_results['Error Flag'] == 'Missing timestamp']
-        for index, row in missing_timestamps.iterrows():
-            mask.loc[row['Start Time']:row['End Time']] = False
+        rows = self._row_slices(missing_timestamps['Start Time'],
+                                missing_timestamps['End Time'])
+        for row in rows:
+            if row is not None:
+                mask[row,:] = False
+
+        mask = pd.DataFrame(mask, index=df.index, columns=df.columns)
 
         self._append_test_results(mask, 'Missing data', min_failures=min_failures)
 
@@ -715,11 +905,19 @@ class PerformanceMonitoring(object):
         if df is None:
             return
 
-        # Extract corrupt data
-        mask = pd.DataFrame(data = np.zeros(df.shape), index = df.index, columns = df.columns, dtype = bool) # all False
-        for i in corrupt_values:
-            mask = mask | (df == i)
-        self.df[mask] = np.nan
+        # Extract corrupt data, np.isin casts corrupt_values to a single
+        # dtype, so it is only used when the values and data are numeric
+        values = df.values
+        if (values.dtype.kind in 'biufc') and \
+                (np.asarray(corrupt_values).dtype.kind in 'biufc'):
+            mask = np.isin(values, corrupt_values)
+            mask = pd.DataFrame(data = mask, index = df.index, columns = df.columns)
+        else:
+            mask = pd.DataFrame(data = np.zeros(df.shape), index = df.index, columns = df.columns, dtype = bool) # all False
+            for i in corrupt_values:
+                mask = mask | (df == i)
+        if mask.values.any():
+            self.df[mask] = np.nan
 
         self._append_test_results(mask, 'Corrupt data', min_failures=min_failures)
 
@@ -762,11 +960,12 @@ def check_increment(data, bound, key=None, increment=1, absolute_value=True,
 
 
 @_documented_by(PerformanceMonitoring.check_delta)
-def check_delta(data, bound, key=None, window=3600, direction=None, min_failures=1):
+def check_delta(data, bound, key=None, window=3600, direction=None, min_failures=1,
+                n_jobs=1):
 
     pm = PerformanceMonitoring()
     pm.add_dataframe(data)
-    pm.check_delta(bound, key, window, direction, min_failures)
+    pm.check_delta(bound, key, window, direction, min_failures, n_jobs)
     mask = pm.mask
 
     return {'cleaned_data': data[mask], 'mask': mask, 'test_results': pm.test_results}
@@ -774,11 +973,11 @@ def check_delta(data, bound, key=None, window=3600, direction=None, min_failures
 
 @_documented_by(PerformanceMonitoring.check_outlier)
 def check_outlier(data, bound, key=None, window=3600, absolute_value=True, 
-                  min_failures=1):
+                  min_failures=1, n_jobs=1):
 
     pm = PerformanceMonitoring()
     pm.add_dataframe(data)
-    pm.check_outlier(bound, key, window, absolute_value, min_failures)
+    pm.check_outlier(bound, key, window, absolute_value, min_failures, n_jobs)
     mask = pm.mask
 
     return {'cleaned_data': data[mask], 'mask': mask, 'test_results': pm.test_results}
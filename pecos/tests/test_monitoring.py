@@ -144,6 +144,16 @@ class Test_simple_example(unittest.TestCase):
         test_results = results['test_results']
         assert_frame_equal(test_results, expected, check_dtype=False)
 
+    def test_check_corrupt_mixed_values(self):
+        # Numeric corrupt values are found when the list also contains strings
+        expected = pd.DataFrame(
+            [('C', pd.Timestamp('2015-01-01 07:30:00'), pd.Timestamp('2015-01-01 09:30:00'), 9.0, 'Corrupt data')],
+            columns=['Variable Name', 'Start Time', 'End Time', 'Timesteps', 'Error Flag'])
+        
+        self.pm.check_corrupt([-999, 'NAN'])
+        test_results = self.pm.test_results[self.pm.test_results['Error Flag'] == 'Corrupt data']
+        assert_frame_equal(test_results.reset_index(drop=True), expected, check_dtype=False)
+
     def test_check_range(self):
         #Column B is below the expected lower bound of 0 at 6:30 and above the expected upper bound of 1 at 15:30
         #Column D is occasionally below the expected lower bound of -1 around midday (2 time steps) and above the expected upper bound of 1 in the early morning and late evening (10 time steps).
@@ -370,6 +380,35 @@ class Test_check_timestamp(unittest.TestCase):
             )
         assert_frame_equal(expected, self.pm.test_results)
 
+    def test_set_test_results(self):
+        self.pm.check_timestamp(3600, exact_times=True)
+        test_results = self.pm.test_results
+        mask = self.pm.mask
+        
+        # The mask is updated when test_results are replaced
+        self.pm.test_results = test_results.iloc[0:0]
+        assert_equal(self.pm.test_results.shape[0], 0)
+        assert_frame_equal(~pd.isnull(self.pm.df), self.pm.mask)
+        
+        self.pm.test_results = test_results
+        assert_frame_equal(test_results, self.pm.test_results)
+        assert_frame_equal(mask, self.pm.mask)
+
+    def test_modify_test_results_in_place(self):
+        self.pm.check_timestamp(3600, exact_times=True)
+        test_results = self.pm.test_results
+        
+        # In-place changes to test_results are used by the mask and kept
+        # when new results are appended
+        test_results.drop(test_results.index, inplace=True)
+        assert_equal(self.pm.test_results.shape[0], 0)
+        assert_frame_equal(~pd.isnull(self.pm.df), self.pm.mask)
+        
+        self.pm.check_range([None, 3])
+        assert_equal(self.pm.test_results.shape[0], 1)
+        assert_equal(self.pm.test_results['Error Flag'][0],
+                     'Data > upper bound, 3')
+
     
 class Test_check_delta(unittest.TestCase):
 
@@ -439,6 +478,13 @@ class Test_check_delta(unittest.TestCase):
             )
         assert_frame_equal(expected, self.pm.test_results)
 
+    def test_abrupt_change_n_jobs(self):
+        # results using multiple threads match results using a single thread
+        results1 = pecos.monitoring.check_delta(self.pm.df, [None, 7], window=3*3600)
+        results2 = pecos.monitoring.check_delta(self.pm.df, [None, 7], window=3*3600, n_jobs=2)
+        assert_frame_equal(results1['test_results'], results2['test_results'])
+        assert_frame_equal(results1['mask'], results2['mask'])
+
     def test_delta_scale(self, output=False):
         # The following function was used to test scalability of the delta test
         # by increasing N and timing results.  The data includes stagnant data and 
@@ -544,5 +590,14 @@ class Test_check_outlier(unittest.TestCase):
             )
         assert_frame_equal(expected, self.pm.test_results)
 
+    def test_outlier_n_jobs(self):
+        # results using multiple threads match results using a single thread
+        df = self.pm.df.copy()
+        df['B'] = df['A'][::-1].values
+        results1 = pecos.monitoring.check_outlier(df, [None, 1.5], window=6*3600)
+        results2 = pecos.monitoring.check_outlier(df, [None, 1.5], window=6*3600, n_jobs=2)
+        assert_frame_equal(results1['test_results'], results2['test_results'])
+        assert_equal(set(results2['test_results']['Variable Name']), set(['A', 'B']))
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,10 +4,20 @@ The utils module contains helper functions.
 import numpy as np
 import pandas as pd
 import re
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
+_keyword_pattern = re.compile(r"\{(.*?)\}")
+
+@functools.lru_cache(maxsize=128)
+def _compile_string(string_to_eval):
+    """
+    Compile (and cache) the string evaluated by evaluate_string
+    """
+    return compile(string_to_eval, '<string>', 'eval')
+
 def index_to_datetime(index, unit='s', origin='unix'):
     """
     Convert DataFrame index from int/float to datetime,
@@ -187,42 +197,45 @@ def evaluate_string(string_to_eval, data=None, trans=None, specs=None, col_name=
     if not isinstance(string_to_eval, str):
         return string_to_eval
     
-    match = re.findall(r"\{(.*?)\}", string_to_eval)
-    for m in set(match):
+    # Build the replacement for each {keyword}
+    mapping = {}
+    for m in set(_keyword_pattern.findall(string_to_eval)):
         m = m.replace('[','') # check for list
 
         if m == 'ELAPSED_TIME':
             ELAPSED_TIME = datetime_to_elapsedtime(data.index)
             ELAPSED_TIME = pd.Series(ELAPSED_TIME, index=data.index)
-            string_to_eval = string_to_eval.replace("{"+m+"}",m)
+            mapping[m] = m
         elif m == 'CLOCK_TIME':
             CLOCK_TIME = datetime_to_clocktime(data.index)
             CLOCK_TIME = pd.Series(CLOCK_TIME, index=data.index)
-            string_to_eval = string_to_eval.replace("{"+m+"}",m)
+            mapping[m] = m
         elif m == 'EPOCH_TIME':
             EPOCH_TIME = datetime_to_epochtime(data.index)
             EPOCH_TIME = pd.Series(EPOCH_TIME, index=data.index)
-            string_to_eval = string_to_eval.replace("{"+m+"}",m)
+            mapping[m] = m
         else:
             try:
                 data[m]
-                datastr = "data[['" + m + "']]" # dataframe
-                string_to_eval = string_to_eval.replace("{"+m+"}",datastr)
+                mapping[m] = "data[['" + m + "']]" # dataframe
             except:
                 try:
                     data[trans[m]]
-                    datastr = "data[trans['" + m + "']]"
-                    string_to_eval = string_to_eval.replace("{"+m+"}",datastr)
+                    mapping[m] = "data[trans['" + m + "']]"
                 except:
                     try:
                         specs[m]
-                        datastr = "specs['" + m + "']"
-                        string_to_eval = string_to_eval.replace("{"+m+"}",datastr)
+                        mapping[m] = "specs['" + m + "']"
                     except:
                         pass
 
+    # Replace all keywords in a single pass
+    string_to_eval = _keyword_pattern.sub(
+            lambda match: mapping.get(match.group(1), match.group(0)),
+            string_to_eval)
+
     try:
-        signal = eval(string_to_eval)
+        signal = eval(_compile_string(string_to_eval))
         
         # Convert Series and tuple of Series to DataFrame
         if isinstance(signal, pd.Series): # Series